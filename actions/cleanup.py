@@ -19,7 +19,10 @@ import subprocess
 import sys
 import traceback
 
-sys.path.append('hooks/')
+_HOOKS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hooks')
+if _HOOKS_DIR not in sys.path:
+    sys.path.append(_HOOKS_DIR)
 
 import charmhelpers.core as ch_core
 import charmhelpers.contrib.openstack.utils as ch_openstack_utils
@@ -17,7 +17,10 @@
 import os
 import sys
 
-sys.path.append('hooks/')
+_HOOKS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hooks')
+if _HOOKS_DIR not in sys.path:
+    sys.path.append(_HOOKS_DIR)
 
 import charmhelpers.contrib.openstack.deferred_events as deferred_events
 import charmhelpers.contrib.openstack.utils as os_utils
@@ -25,7 +28,6 @@ from charmhelpers.core.hookenv import (
     action_get,
     action_fail,
 )
-import neutron_ovs_hooks
 from neutron_ovs_utils import (
     assess_status,
     pause_unit_helper,
@@ -82,6 +84,9 @@ def _run_deferred_hooks():
     if not deferred_events.is_restart_permitted():
         deferred_hooks = deferred_events.get_deferred_hooks()
         if deferred_hooks and 'config-changed' in deferred_hooks:
+            # NOTE: neutron_ovs_hooks registers its configs at import time,
+            # only import it when a deferred hook actually needs running.
+            import neutron_ovs_hooks
             neutron_ovs_hooks.config_changed(check_deferred_restarts=False)
             deferred_events.clear_deferred_hook('config-changed')
 
@@ -115,17 +120,15 @@ ACTIONS = {"pause": pause, "resume": resume, "restart-services": restart,
 
 def main(args):
     action_name = os.path.basename(args[0])
-    try:
-        action = ACTIONS[action_name]
-    except KeyError:
+    action = ACTIONS.get(action_name)
+    if action is None:
         s = "Action {} undefined".format(action_name)
         action_fail(s)
         return s
-    else:
-        try:
-            action(args)
-        except Exception as e:
-            action_fail("Action {} failed: {}".format(action_name, str(e)))
+    try:
+        action(args)
+    except Exception as e:
+        action_fail("Action {} failed: {}".format(action_name, str(e)))
 
 
 if __name__ == "__main__":